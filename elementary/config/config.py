@@ -1,10 +1,8 @@
+import functools
 import os
 from pathlib import Path
-from typing import Optional
-
-import google.auth
-from dateutil import tz
-from google.auth.exceptions import DefaultCredentialsError
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from elementary.clients.dbt.dbt_runner import DbtRunner
 from elementary.exceptions.exceptions import InvalidArgumentsError
@@ -12,6 +10,23 @@ from elementary.monitor import dbt_project_utils
 from elementary.utils.ordered_yaml import OrderedYaml
 
 
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(val) for key, val in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    config_file_path: str, mtime_ns: int, size: int, inode: int
+) -> Mapping:
+    # The file stats are only used as the cache key, so rewriting the file invalidates the entry.
+    # The parsed config is shared between Config instances, so it is frozen all the way down.
+    return _freeze(OrderedYaml().load(config_file_path) or {})
+
+
 class Config:
     _SLACK = "slack"
     _AWS = "aws"
@@ -29,8 +44,44 @@ class Config:
     }
     _QUOTING_VALID_KEYS = set(_QUOTING_KEY_MAPPING.keys())
     _QUOTING_ENV_VARS = set(_QUOTING_KEY_MAPPING.values())
-
-    DEFAULT_CONFIG_DIR = str(Path.home() / ".edr")
+    _ALL_QUOTING_ENV_VARS = MappingProxyType(
+        {env_var: "True" for env_var in _QUOTING_ENV_VARS}
+    )
+    _NO_QUOTING_ENV_VARS = MappingProxyType(
+        {env_var: "False" for env_var in _QUOTING_ENV_VARS}
+    )
+    _QUOTING_PRESETS = {"all": _ALL_QUOTING_ENV_VARS, "none": _NO_QUOTING_ENV_VARS}
+
+    DEFAULT_CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".edr")
+
+    __slots__ = (
+        "config_dir",
+        "profiles_dir",
+        "project_dir",
+        "profile_target",
+        "project_profile_target",
+        "env",
+        "dbt_env_vars",
+        "target_dir",
+        "update_bucket_website",
+        "timezone",
+        "slack_webhook",
+        "slack_token",
+        "slack_channel_name",
+        "is_slack_workflow",
+        "aws_profile_name",
+        "s3_endpoint_url",
+        "s3_bucket_name",
+        "aws_access_key_id",
+        "aws_secret_access_key",
+        "google_project_name",
+        "google_service_account_path",
+        "gcs_bucket_name",
+        "anonymous_tracking_enabled",
+        "has_slack",
+        "has_s3",
+        "_has_gcloud",
+    )
 
     def __init__(
         self,
@@ -132,13 +183,27 @@ class Config:
 
         self.anonymous_tracking_enabled = config.get("anonymous_usage_tracking", True)
 
-    def _load_configuration(self) -> dict:
-        if not os.path.exists(self.config_dir):
-            os.makedirs(self.config_dir)
+        self.has_slack = bool(
+            self.slack_webhook or (self.slack_token and self.slack_channel_name)
+        )
+        self.has_s3 = bool(self.s3_bucket_name)
+
+        # Resolved lazily by has_gcloud, probing for default credentials is slow.
+        self._has_gcloud = None
+
+    def _load_configuration(self) -> Mapping:
+        Path(self.config_dir).mkdir(parents=True, exist_ok=True)
         config_file_path = os.path.join(self.config_dir, self._CONFIG_FILE_NAME)
-        if not os.path.exists(config_file_path):
+        try:
+            config_file_stat = os.stat(config_file_path)
+        except FileNotFoundError:
             return {}
-        return OrderedYaml().load(config_file_path) or {}
+        return _load_config_cached(
+            config_file_path,
+            config_file_stat.st_mtime_ns,
+            config_file_stat.st_size,
+            config_file_stat.st_ino,
+        )
 
     @property
     def has_send_report_platform(self):
@@ -148,22 +213,24 @@ class Config:
             or self.has_gcs
         )
 
-    @property
-    def has_slack(self) -> bool:
-        return self.slack_webhook or (self.slack_token and self.slack_channel_name)
-
-    @property
-    def has_s3(self):
-        return self.s3_bucket_name
-
     @property
     def has_gcloud(self):
         if self.google_service_account_path:
             return True
+        if self._has_gcloud is None:
+            self._has_gcloud = self._has_default_google_credentials()
+        return self._has_gcloud
+
+    @staticmethod
+    def _has_default_google_credentials() -> bool:
+        # Imported lazily, google.auth is slow to import and only needed for GCS.
+        import google.auth
+        from google.auth.exceptions import DefaultCredentialsError, TransportError
+
         try:
             google.auth.default()
             return True
-        except DefaultCredentialsError:
+        except (DefaultCredentialsError, TransportError):
             return False
 
     @property
@@ -198,22 +265,27 @@ class Config:
         dbt_runner.debug(quiet=True)
 
     def _validate_timezone(self):
+        from dateutil import tz
+
         if self.timezone and not tz.gettz(self.timezone):
             raise InvalidArgumentsError("An invalid timezone was provided.")
 
     @staticmethod
-    def _first_not_none(*values):
-        return next((v for v in values if v is not None), None)
+    def _first_not_none(first, second, third=None):
+        if first is not None:
+            return first
+        if second is not None:
+            return second
+        return third
 
     @classmethod
-    def _parse_dbt_quoting_to_env_vars(cls, dbt_quoting):
+    def _parse_dbt_quoting_to_env_vars(cls, dbt_quoting) -> Mapping[str, str]:
         if dbt_quoting is None:
             return {}
 
-        if dbt_quoting == "all":
-            return {env_var: "True" for env_var in cls._QUOTING_ENV_VARS}
-        elif dbt_quoting == "none":
-            return {env_var: "False" for env_var in cls._QUOTING_ENV_VARS}
+        preset_env_vars = cls._QUOTING_PRESETS.get(dbt_quoting)
+        if preset_env_vars is not None:
+            return preset_env_vars
 
         dbt_quoting_keys = {part.strip() for part in dbt_quoting.split(",")}
         if not dbt_quoting_keys.issubset(cls._QUOTING_VALID_KEYS):
@@ -221,12 +293,10 @@ class Config:
                 "Invalid quoting specification: %s" % dbt_quoting
             )
 
-        env_vars = {env_var: "False" for env_var in cls._QUOTING_ENV_VARS}
-        env_vars.update(
-            {cls._QUOTING_KEY_MAPPING[key]: "True" for key in dbt_quoting_keys}
-        )
-
-        return env_vars
+        return {
+            env_var: "True" if key in dbt_quoting_keys else "False"
+            for key, env_var in cls._QUOTING_KEY_MAPPING.items()
+        }
 
     @staticmethod
     def locate_user_project_dir() -> Optional[str]:
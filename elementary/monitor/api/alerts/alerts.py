@@ -301,7 +301,4 @@ class AlertsAPI(APIClient):
 
     @staticmethod
     def _split_list_to_chunks(items: list, chunk_size: int = 50) -> List[List]:
-        chunk_list = []
-        for i in range(0, len(items), chunk_size):
-            chunk_list.append(items[i : i + chunk_size])
-        return chunk_list
+        return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
@@ -1,19 +1,26 @@
 from ruamel.yaml import YAML
 
+# Shared across OrderedYaml instances so they don't rebuild the ruamel loaders on every use.
+_round_trip_yaml = YAML()
+_round_trip_yaml.indent(mapping=2, sequence=4, offset=2)
+_round_trip_yaml.preserve_quotes = True
+# Loading doesn't need the round-trip types, plain dicts keep insertion order.
+# The safe loader uses the libyaml-backed C parser when it is installed.
+_safe_yaml = YAML(typ="safe")
+
 
 class OrderedYaml:
     def __init__(self) -> None:
-        self.ordered_yaml = YAML()
-        self.ordered_yaml.indent(mapping=2, sequence=4, offset=2)
-        self.ordered_yaml.preserve_quotes = True
+        self.ordered_yaml = _round_trip_yaml
+        self.safe_yaml = _safe_yaml
 
     def load(self, file_path: str) -> dict:
         with open(file_path, "r", encoding="utf-8") as file_obj:
-            return self.ordered_yaml.load(file_obj)
+            return self.safe_yaml.load(file_obj)
 
     def dump(self, data: dict, file_path: str) -> dict:
         with open(file_path, "w", encoding="utf-8") as file_obj:
             return self.ordered_yaml.dump(data, file_obj)
 
     def loads(self, yaml_str: str) -> dict:
-        return self.ordered_yaml.load(yaml_str)
+        return self.safe_yaml.load(yaml_str)
@@ -1,5 +1,3 @@
-import json
-
 from tests.mocks.api.alerts_api_mock import MockAlertsAPI
 
 
@@ -40,12 +38,12 @@ def assert_new_alerts(new_alerts):
     #   - Alert after suppression interval
     #   - Alert without suppression interval
     #   - First occurrence alert with suppression interval
-    assert json.dumps(
-        [alert.id for alert in alerts_to_send], sort_keys=True
-    ) == json.dumps(["alert_id_2", "alert_id_3", "alert_id_4"], sort_keys=True)
+    assert [alert.id for alert in alerts_to_send] == [
+        "alert_id_2",
+        "alert_id_3",
+        "alert_id_4",
+    ]
 
     # Test the following tests are suppresed:
     #   - Alert whithin suppression interval
-    assert json.dumps(
-        [alert.id for alert in alerts_to_skip], sort_keys=True
-    ) == json.dumps(["alert_id_1"], sort_keys=True)
+    assert [alert.id for alert in alerts_to_skip] == ["alert_id_1"]
@@ -1,9 +1,11 @@
 import os
 import tempfile
+from unittest import mock
 
 import pytest
 
-from elementary.config.config import Config
+from elementary.config.config import Config, _load_config_cached
+from elementary.exceptions.exceptions import InvalidArgumentsError
 from elementary.utils.ordered_yaml import OrderedYaml
 
 FILE_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -57,3 +59,60 @@ def test_config_get_slack_notification_channel_name(config: Config):
 @pytest.mark.parametrize("config", [WORKFLOWS_CONFIG], indirect=["config"])
 def test_slack_workflows_config_get_workflows(config: Config):
     assert config.is_slack_workflow == WORKFLOWS_CONFIG["slack"]["workflows"]
+
+
+@pytest.mark.parametrize("config", [CONFIG], indirect=["config"])
+def test_config_platforms(config: Config):
+    assert config.has_slack is True
+    assert config.has_s3 is False
+    assert config.has_send_report_platform
+
+
+def test_config_file_is_reloaded_when_modified():
+    _load_config_cached.cache_clear()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_config_files(temp_dir, CONFIG)
+        assert Config(config_dir=temp_dir).is_slack_workflow is False
+        assert Config(config_dir=temp_dir).is_slack_workflow is False
+        assert _load_config_cached.cache_info().hits == 1
+
+        # Rewritten right away, without waiting for the mtime to move forward.
+        create_config_files(temp_dir, WORKFLOWS_CONFIG)
+        assert Config(config_dir=temp_dir).is_slack_workflow is True
+
+
+@pytest.mark.parametrize("config", [CONFIG], indirect=["config"])
+def test_loaded_config_is_read_only(config: Config):
+    loaded_config = config._load_configuration()
+    with pytest.raises(TypeError):
+        loaded_config["slack"]["token"] = "another_token"
+
+
+def test_parse_dbt_quoting_to_env_vars():
+    assert Config._parse_dbt_quoting_to_env_vars(None) == {}
+    assert Config._parse_dbt_quoting_to_env_vars("all") == {
+        "DATABASE_QUOTING": "True",
+        "SCHEMA_QUOTING": "True",
+        "IDENTIFIER_QUOTING": "True",
+    }
+    assert Config._parse_dbt_quoting_to_env_vars("none") == {
+        "DATABASE_QUOTING": "False",
+        "SCHEMA_QUOTING": "False",
+        "IDENTIFIER_QUOTING": "False",
+    }
+    assert Config._parse_dbt_quoting_to_env_vars("database, identifier") == {
+        "DATABASE_QUOTING": "True",
+        "SCHEMA_QUOTING": "False",
+        "IDENTIFIER_QUOTING": "True",
+    }
+    with pytest.raises(InvalidArgumentsError):
+        Config._parse_dbt_quoting_to_env_vars("database,table")
+
+
+def test_has_gcloud_probes_default_credentials_once():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config(config_dir=temp_dir)
+        with mock.patch("google.auth.default") as mock_default:
+            assert config.has_gcloud
+            assert config.has_gcloud
+        assert mock_default.call_count == 1
@@ -20,12 +20,8 @@ def test_get_suppressed_alerts(alerts_api_mock: MockAlertsAPI):
         model_alerts, last_model_alert_sent_times
     )
 
-    assert json.dumps(suppressed_test_alerts, sort_keys=True) == json.dumps(
-        ["alert_id_1"], sort_keys=True
-    )
-    assert json.dumps(suppressed_model_alerts, sort_keys=True) == json.dumps(
-        ["alert_id_1"], sort_keys=True
-    )
+    assert suppressed_test_alerts == ["alert_id_1"]
+    assert suppressed_model_alerts == ["alert_id_1"]
 
 
 def test_split_list_to_chunks(alerts_api_mock: MockAlertsAPI):